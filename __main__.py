@@ -1,28 +1,30 @@
 """A Kubernetes Python Pulumi program"""
 
-import pulumi
-import pulumi_kubernetes as kubernetes
-from pulumi_kubernetes.apps.v1 import Deployment
-from pulumi_kubernetes.core.v1 import (
-    Pod,
-    PodSpecArgs,
-    PersistentVolume,
-    PersistentVolumeSpecArgs,
-    PersistentVolumeClaim,
-    PersistentVolumeClaimSpecArgs,
-    PersistentVolumeClaimVolumeSourceArgs,
-    NFSVolumeSourceArgs,
-    CSIPersistentVolumeSourceArgs,
-    VolumeArgs,
-    ContainerArgs,
-    ContainerPortArgs,
-    SecurityContextArgs,
-    VolumeMountArgs,
-    VolumeArgsDict,
-    VolumeResourceRequirementsArgs,
-    EnvVarArgs,
-)
-from pulumi_kubernetes.meta.v1 import ObjectMetaArgs
+from import_profile import ImportProfile
+
+profile = ImportProfile()
+with profile.measure("pulumi"):
+    import pulumi
+
+config = pulumi.Config()
+profile.enabled = config.get_bool("profileImports") or False
+
+with profile.measure("pulumi_kubernetes"):
+    import pulumi_kubernetes as kubernetes
+with profile.measure("pulumi_kubernetes.core.v1"):
+    from pulumi_kubernetes.core.v1 import (
+        PersistentVolumeClaim,
+        PersistentVolumeClaimSpecArgs,
+        VolumeResourceRequirementsArgs,
+    )
+with profile.measure("pulumi_kubernetes.meta.v1"):
+    from pulumi_kubernetes.meta.v1 import ObjectMetaArgs
+with profile.measure("pulumi_kubernetes.rbac.v1"):
+    import pulumi_kubernetes.rbac.v1
+with profile.measure("pulumi_kubernetes.apps.v1"):
+    import pulumi_kubernetes.apps.v1
+with profile.measure("pulumi_kubernetes.storage.v1"):
+    import pulumi_kubernetes.storage.v1
 
 pvc = PersistentVolumeClaim(
     "nfs-pvc",
@@ -458,233 +460,9 @@ example_nfs_storage_class = kubernetes.storage.v1.StorageClass(
     opts=pulumi.ResourceOptions(protect=False),
 )
 
-nfs_pvc = kubernetes.core.v1.PersistentVolumeClaim(
-    "nfs",
-    api_version="v1",
-    kind="PersistentVolumeClaim",
-    metadata={
-        "annotations": {
-            "pv_kubernetes_io_bind_completed": "yes",
-            "pv_kubernetes_io_bound_by_controller": "yes",
-            "volume_beta_kubernetes_io_storage_provisioner": "example.com/nfs",
-            "volume_kubernetes_io_storage_provisioner": "example.com/nfs",
-        },
-        "finalizers": ["kubernetes.io/pvc-protection"],
-        "name": "nfs",
-        "namespace": "default",
-    },
-    spec={
-        "access_modes": ["ReadWriteMany"],
-        "resources": {
-            "requests": {
-                "storage": "1Mi",
-            },
-        },
-        "storage_class_name": "example-nfs",
-        "volume_mode": "Filesystem",
-    },
-    opts=pulumi.ResourceOptions(protect=False),
-)
-
-write_pod = kubernetes.core.v1.Pod(
-    "write-pod",
-    api_version="v1",
-    kind="Pod",
-    metadata={
-        "annotations": {},
-        "name": "write-pod",
-        "namespace": "default",
-    },
-    spec={
-        "containers": [
-            {
-                "args": [
-                    "-c",
-                    "touch /mnt/SUCCESS && exit 0 || exit 1",
-                ],
-                "command": ["/bin/sh"],
-                "image": "gcr.io/google_containers/busybox:1.24",
-                "image_pull_policy": "IfNotPresent",
-                "name": "write-pod",
-                "resources": {},
-                "termination_message_path": "/dev/termination-log",
-                "termination_message_policy": "File",
-                "volume_mounts": [
-                    {
-                        "mount_path": "/mnt",
-                        "name": "nfs-pvc",
-                    },
-                ],
-            }
-        ],
-        "dns_policy": "ClusterFirst",
-        "enable_service_links": True,
-        "node_name": "k3s-k8s-rs-79c0-d6fed8-node-pool-4c4d-sftfs",
-        "preemption_policy": "PreemptLowerPriority",
-        "priority": 0,
-        "restart_policy": "Never",
-        "scheduler_name": "default-scheduler",
-        "security_context": {},
-        "service_account": "default",
-        "service_account_name": "default",
-        "termination_grace_period_seconds": 30,
-        "tolerations": [
-            {
-                "effect": "NoExecute",
-                "key": "node.kubernetes.io/not-ready",
-                "operator": "Exists",
-                "toleration_seconds": 300,
-            },
-            {
-                "effect": "NoExecute",
-                "key": "node.kubernetes.io/unreachable",
-                "operator": "Exists",
-                "toleration_seconds": 300,
-            },
-        ],
-        "volumes": [
-            {
-                "name": "nfs-pvc",
-                "persistent_volume_claim": {
-                    "claim_name": "nfs",
-                },
-            },
-        ],
-    },
-    opts=pulumi.ResourceOptions(protect=False),
-)
+if config.get_bool("demo"):
+    with profile.measure("demo_clients"):
+        from demo_clients import create_demo_clients
+    create_demo_clients(example_nfs_storage_class)
 
-read_pod = kubernetes.core.v1.Pod(
-    "read-pod",
-    api_version="v1",
-    kind="Pod",
-    metadata={
-        "annotations": {},
-        "name": "read-pod",
-        "namespace": "default",
-    },
-    spec={
-        "containers": [
-            {
-                "args": [
-                    "-c",
-                    "test -f /mnt/SUCCESS && exit 0 || exit 1",
-                ],
-                "command": ["/bin/sh"],
-                "image": "gcr.io/google_containers/busybox:1.24",
-                "image_pull_policy": "IfNotPresent",
-                "name": "read-pod",
-                "resources": {},
-                "termination_message_path": "/dev/termination-log",
-                "termination_message_policy": "File",
-                "volume_mounts": [
-                    {
-                        "mount_path": "/mnt",
-                        "name": "nfs-pvc",
-                    },
-                ],
-            }
-        ],
-        "dns_policy": "ClusterFirst",
-        "enable_service_links": True,
-        "node_name": "k3s-k8s-rs-79c0-d6fed8-node-pool-4c4d-sftfs",
-        "preemption_policy": "PreemptLowerPriority",
-        "priority": 0,
-        "restart_policy": "Never",
-        "scheduler_name": "default-scheduler",
-        "security_context": {},
-        "service_account": "default",
-        "service_account_name": "default",
-        "termination_grace_period_seconds": 30,
-        "tolerations": [
-            {
-                "effect": "NoExecute",
-                "key": "node.kubernetes.io/not-ready",
-                "operator": "Exists",
-                "toleration_seconds": 300,
-            },
-            {
-                "effect": "NoExecute",
-                "key": "node.kubernetes.io/unreachable",
-                "operator": "Exists",
-                "toleration_seconds": 300,
-            },
-        ],
-        "volumes": [
-            {
-                "name": "nfs-pvc",
-                "persistent_volume_claim": {
-                    "claim_name": "nfs",
-                },
-            },
-        ],
-    },
-    opts=pulumi.ResourceOptions(protect=False),
-)
-
-nginx = kubernetes.core.v1.Pod(
-    "nginx",
-    api_version="v1",
-    kind="Pod",
-    metadata={
-        "annotations": {},
-        "labels": {
-            "run": "nginx",
-        },
-        "name": "nginx",
-        "namespace": "default",
-    },
-    spec={
-        "containers": [
-            {
-                "image": "nginx",
-                "image_pull_policy": "Always",
-                "name": "nginx",
-                "resources": {},
-                "termination_message_path": "/dev/termination-log",
-                "termination_message_policy": "File",
-                "volume_mounts": [
-                    {
-                        "mount_path": "/var/nfs",
-                        "name": "nfs-vol",
-                    },
-                ],
-            }
-        ],
-        "dns_policy": "ClusterFirst",
-        "enable_service_links": True,
-        "node_name": "k3s-k8s-rs-79c0-d6fed8-node-pool-4c4d-7vl2i",
-        "preemption_policy": "PreemptLowerPriority",
-        "priority": 0,
-        "restart_policy": "Always",
-        "scheduler_name": "default-scheduler",
-        "security_context": {},
-        "service_account": "default",
-        "service_account_name": "default",
-        "termination_grace_period_seconds": 30,
-        "tolerations": [
-            {
-                "effect": "NoExecute",
-                "key": "node.kubernetes.io/not-ready",
-                "operator": "Exists",
-                "toleration_seconds": 300,
-            },
-            {
-                "effect": "NoExecute",
-                "key": "node.kubernetes.io/unreachable",
-                "operator": "Exists",
-                "toleration_seconds": 300,
-            },
-        ],
-        "volumes": [
-            {
-                "name": "nfs-vol",
-                "nfs": {
-                    "path": "/export",
-                    "server": "10.43.221.251",
-                },
-            },
-        ],
-    },
-    opts=pulumi.ResourceOptions(protect=False),
-)
+profile.report()
@@ -0,0 +1,241 @@
+"""Demo clients that exercise the NFS provisioner.
+
+Only imported and built when the `demo` config flag is enabled.
+"""
+
+import pulumi
+import pulumi_kubernetes as kubernetes
+
+
+def create_demo_clients(storage_class: kubernetes.storage.v1.StorageClass) -> None:
+    """Create a claim on `storage_class` plus pods that write to and read from it."""
+    nfs_pvc = kubernetes.core.v1.PersistentVolumeClaim(
+        "nfs",
+        api_version="v1",
+        kind="PersistentVolumeClaim",
+        metadata={
+            "annotations": {
+                "pv_kubernetes_io_bind_completed": "yes",
+                "pv_kubernetes_io_bound_by_controller": "yes",
+                "volume_beta_kubernetes_io_storage_provisioner": "example.com/nfs",
+                "volume_kubernetes_io_storage_provisioner": "example.com/nfs",
+            },
+            "finalizers": ["kubernetes.io/pvc-protection"],
+            "name": "nfs",
+            "namespace": "default",
+        },
+        spec={
+            "access_modes": ["ReadWriteMany"],
+            "resources": {
+                "requests": {
+                    "storage": "1Mi",
+                },
+            },
+            "storage_class_name": storage_class.metadata.name,
+            "volume_mode": "Filesystem",
+        },
+        opts=pulumi.ResourceOptions(protect=False),
+    )
+
+    kubernetes.core.v1.Pod(
+        "write-pod",
+        api_version="v1",
+        kind="Pod",
+        metadata={
+            "annotations": {},
+            "name": "write-pod",
+            "namespace": "default",
+        },
+        spec={
+            "containers": [
+                {
+                    "args": [
+                        "-c",
+                        "touch /mnt/SUCCESS && exit 0 || exit 1",
+                    ],
+                    "command": ["/bin/sh"],
+                    "image": "gcr.io/google_containers/busybox:1.24",
+                    "image_pull_policy": "IfNotPresent",
+                    "name": "write-pod",
+                    "resources": {},
+                    "termination_message_path": "/dev/termination-log",
+                    "termination_message_policy": "File",
+                    "volume_mounts": [
+                        {
+                            "mount_path": "/mnt",
+                            "name": "nfs-pvc",
+                        },
+                    ],
+                }
+            ],
+            "dns_policy": "ClusterFirst",
+            "enable_service_links": True,
+            "node_name": "k3s-k8s-rs-79c0-d6fed8-node-pool-4c4d-sftfs",
+            "preemption_policy": "PreemptLowerPriority",
+            "priority": 0,
+            "restart_policy": "Never",
+            "scheduler_name": "default-scheduler",
+            "security_context": {},
+            "service_account": "default",
+            "service_account_name": "default",
+            "termination_grace_period_seconds": 30,
+            "tolerations": [
+                {
+                    "effect": "NoExecute",
+                    "key": "node.kubernetes.io/not-ready",
+                    "operator": "Exists",
+                    "toleration_seconds": 300,
+                },
+                {
+                    "effect": "NoExecute",
+                    "key": "node.kubernetes.io/unreachable",
+                    "operator": "Exists",
+                    "toleration_seconds": 300,
+                },
+            ],
+            "volumes": [
+                {
+                    "name": "nfs-pvc",
+                    "persistent_volume_claim": {
+                        "claim_name": nfs_pvc.metadata.name,
+                    },
+                },
+            ],
+        },
+        opts=pulumi.ResourceOptions(protect=False),
+    )
+
+    kubernetes.core.v1.Pod(
+        "read-pod",
+        api_version="v1",
+        kind="Pod",
+        metadata={
+            "annotations": {},
+            "name": "read-pod",
+            "namespace": "default",
+        },
+        spec={
+            "containers": [
+                {
+                    "args": [
+                        "-c",
+                        "test -f /mnt/SUCCESS && exit 0 || exit 1",
+                    ],
+                    "command": ["/bin/sh"],
+                    "image": "gcr.io/google_containers/busybox:1.24",
+                    "image_pull_policy": "IfNotPresent",
+                    "name": "read-pod",
+                    "resources": {},
+                    "termination_message_path": "/dev/termination-log",
+                    "termination_message_policy": "File",
+                    "volume_mounts": [
+                        {
+                            "mount_path": "/mnt",
+                            "name": "nfs-pvc",
+                        },
+                    ],
+                }
+            ],
+            "dns_policy": "ClusterFirst",
+            "enable_service_links": True,
+            "node_name": "k3s-k8s-rs-79c0-d6fed8-node-pool-4c4d-sftfs",
+            "preemption_policy": "PreemptLowerPriority",
+            "priority": 0,
+            "restart_policy": "Never",
+            "scheduler_name": "default-scheduler",
+            "security_context": {},
+            "service_account": "default",
+            "service_account_name": "default",
+            "termination_grace_period_seconds": 30,
+            "tolerations": [
+                {
+                    "effect": "NoExecute",
+                    "key": "node.kubernetes.io/not-ready",
+                    "operator": "Exists",
+                    "toleration_seconds": 300,
+                },
+                {
+                    "effect": "NoExecute",
+                    "key": "node.kubernetes.io/unreachable",
+                    "operator": "Exists",
+                    "toleration_seconds": 300,
+                },
+            ],
+            "volumes": [
+                {
+                    "name": "nfs-pvc",
+                    "persistent_volume_claim": {
+                        "claim_name": nfs_pvc.metadata.name,
+                    },
+                },
+            ],
+        },
+        opts=pulumi.ResourceOptions(protect=False),
+    )
+
+    kubernetes.core.v1.Pod(
+        "nginx",
+        api_version="v1",
+        kind="Pod",
+        metadata={
+            "annotations": {},
+            "labels": {
+                "run": "nginx",
+            },
+            "name": "nginx",
+            "namespace": "default",
+        },
+        spec={
+            "containers": [
+                {
+                    "image": "nginx",
+                    "image_pull_policy": "Always",
+                    "name": "nginx",
+                    "resources": {},
+                    "termination_message_path": "/dev/termination-log",
+                    "termination_message_policy": "File",
+                    "volume_mounts": [
+                        {
+                            "mount_path": "/var/nfs",
+                            "name": "nfs-vol",
+                        },
+                    ],
+                }
+            ],
+            "dns_policy": "ClusterFirst",
+            "enable_service_links": True,
+            "node_name": "k3s-k8s-rs-79c0-d6fed8-node-pool-4c4d-7vl2i",
+            "preemption_policy": "PreemptLowerPriority",
+            "priority": 0,
+            "restart_policy": "Always",
+            "scheduler_name": "default-scheduler",
+            "security_context": {},
+            "service_account": "default",
+            "service_account_name": "default",
+            "termination_grace_period_seconds": 30,
+            "tolerations": [
+                {
+                    "effect": "NoExecute",
+                    "key": "node.kubernetes.io/not-ready",
+                    "operator": "Exists",
+                    "toleration_seconds": 300,
+                },
+                {
+                    "effect": "NoExecute",
+                    "key": "node.kubernetes.io/unreachable",
+                    "operator": "Exists",
+                    "toleration_seconds": 300,
+                },
+            ],
+            "volumes": [
+                {
+                    "name": "nfs-vol",
+                    "nfs": {
+                        "path": "/export",
+                        "server": "10.43.221.251",
+                    },
+                },
+            ],
+        },
+        opts=pulumi.ResourceOptions(protect=False),
+    )
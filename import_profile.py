@@ -0,0 +1,48 @@
+"""Report how long the program spends loading modules.
+
+Enabled with `pulumi config set profileImports true`; each measured import is
+logged with its wall time and the number of modules it pulled in. This module
+only uses the standard library so that `import pulumi` itself can be measured.
+"""
+
+import sys
+import time
+from contextlib import contextmanager
+from typing import List, Tuple
+
+
+class ImportProfile:
+    def __init__(self):
+        # CPU time spent before the program started: interpreter startup and,
+        # under the language host, its own import of the pulumi SDK.
+        self.startup_cpu_seconds = time.process_time()
+        self.enabled = False
+        self.entries: List[Tuple[str, float, int]] = []
+
+    @contextmanager
+    def measure(self, name: str):
+        # Always record: the config that enables reporting can only be read
+        # once pulumi itself has been imported.
+        loaded = len(sys.modules)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.entries.append(
+                (name, time.perf_counter() - start, len(sys.modules) - loaded)
+            )
+
+    def report(self) -> None:
+        if not self.enabled:
+            return
+        import pulumi
+
+        pulumi.log.info(
+            f"startup before program: {self.startup_cpu_seconds * 1000:.1f}ms CPU"
+        )
+        for name, seconds, modules in sorted(self.entries, key=lambda e: -e[1]):
+            pulumi.log.info(
+                f"import {name}: {seconds * 1000:.1f}ms ({modules} modules)"
+            )
+        total = sum(seconds for _, seconds, _ in self.entries)
+        pulumi.log.info(f"measured imports: {total * 1000:.1f}ms")
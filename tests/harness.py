@@ -0,0 +1,132 @@
+"""Evaluate the Pulumi program offline under `pulumi.runtime.set_mocks`.
+
+Every resource the program registers is captured by `RecordingMocks` and
+rendered to YAML so it can be compared against the golden files in
+`tests/snapshots/<scenario>`. Run `UPDATE_SNAPSHOTS=1 python -m pytest` to
+rewrite them, and `UPDATE_BENCHMARK_BASELINE=1` to re-measure
+`tests/snapshots/benchmark.json`.
+"""
+
+import json
+import os
+import runpy
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pulumi
+import yaml
+
+PROGRAM_DIR = Path(__file__).resolve().parent.parent
+SNAPSHOT_DIR = Path(__file__).resolve().parent / "snapshots"
+BENCHMARK_BASELINE = SNAPSHOT_DIR / "benchmark.json"
+UPDATE_SNAPSHOTS = os.environ.get("UPDATE_SNAPSHOTS", "") not in ("", "0")
+UPDATE_BENCHMARK_BASELINE = os.environ.get("UPDATE_BENCHMARK_BASELINE", "") not in (
+    "",
+    "0",
+)
+
+# Stack config for each snapshotted variant of the program.
+SCENARIOS: Dict[str, Dict[str, str]] = {
+    "default": {},
+    "demo": {"kube_nfs:demo": "true"},
+}
+
+
+class RecordingMocks(pulumi.runtime.Mocks):
+    """Mocks that echo inputs back as outputs and record each registration."""
+
+    def __init__(self):
+        self.registrations: List[pulumi.runtime.MockResourceArgs] = []
+
+    def new_resource(self, args: pulumi.runtime.MockResourceArgs):
+        self.registrations.append(args)
+        return [f"{args.name}-id", args.inputs]
+
+    def call(self, args: pulumi.runtime.MockCallArgs):
+        return {}
+
+
+@dataclass
+class ProgramRun:
+    registrations: List[pulumi.runtime.MockResourceArgs] = field(default_factory=list)
+    evaluation_seconds: float = 0.0
+    registration_seconds: float = 0.0
+
+
+def run_program(config: Optional[Dict[str, str]] = None) -> ProgramRun:
+    """Run the program once with `config` and wait for every registration."""
+    mocks = RecordingMocks()
+    pulumi.runtime.set_mocks(mocks, project="kube_nfs", stack="test", preview=False)
+    pulumi.runtime.set_all_config(config or {})
+    run = ProgramRun(registrations=mocks.registrations)
+    start = time.perf_counter()
+
+    @pulumi.runtime.test
+    def evaluate():
+        # Run the directory, as the language host does, so that sibling
+        # modules of __main__.py are importable.
+        runpy.run_path(str(PROGRAM_DIR))
+        run.evaluation_seconds = time.perf_counter() - start
+
+    evaluate()
+    run.registration_seconds = time.perf_counter() - start
+    return run
+
+
+# Runs in a fresh interpreter so the timing includes loading pulumi,
+# pulumi_kubernetes and the program's own modules.
+_COLD_START = """
+import json, sys, time
+start = time.perf_counter()
+sys.path.insert(0, sys.argv[1])
+from harness import run_program
+run_program(json.loads(sys.argv[2]))
+print(time.perf_counter() - start)
+"""
+
+
+def run_program_cold(config: Optional[Dict[str, str]] = None) -> float:
+    """Run the program in a new interpreter and return its startup-to-done time."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            _COLD_START,
+            str(Path(__file__).resolve().parent),
+            json.dumps(config or {}),
+        ],
+        cwd=PROGRAM_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def snapshot_name(args: pulumi.runtime.MockResourceArgs) -> str:
+    kind = args.typ.rsplit(":", 1)[-1]
+    return f"{kind}-{args.name}.yaml"
+
+
+def _plain(value):
+    # Inputs cross the mock boundary as protobuf Structs, so every number
+    # arrives as a float; render whole numbers the way a manifest would.
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def render(args: pulumi.runtime.MockResourceArgs) -> str:
+    return yaml.safe_dump(
+        {"type": args.typ, "name": args.name, "inputs": _plain(args.inputs)},
+        default_flow_style=False,
+        sort_keys=True,
+    )
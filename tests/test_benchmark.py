@@ -0,0 +1,103 @@
+import json
+import os
+import time
+
+import pytest
+
+from harness import (
+    BENCHMARK_BASELINE,
+    SCENARIOS,
+    UPDATE_BENCHMARK_BASELINE,
+    run_program,
+    run_program_cold,
+)
+
+ROUNDS = 10
+COLD_ROUNDS = 3
+METRICS = ("cold_start", "evaluation", "registration")
+# Allowed slowdown relative to the committed baseline, e.g. 1.0 is +100%.
+# Timings on shared runners vary by ~50% between runs, so keep some headroom.
+TOLERANCE = float(os.environ.get("BENCHMARK_TOLERANCE", "1.0"))
+# When set, an absolute limit in seconds replaces the baseline check for that
+# metric, e.g. MAX_COLD_START_SECONDS=3 on a runner the baseline doesn't suit.
+LIMITS = {
+    metric: float(os.environ[f"MAX_{metric.upper()}_SECONDS"])
+    for metric in METRICS
+    if os.environ.get(f"MAX_{metric.upper()}_SECONDS")
+}
+
+
+def calibrate() -> float:
+    """Time a fixed pure-Python workload; the baseline is stored in its units."""
+    start = time.perf_counter()
+    table = {}
+    for i in range(50_000):
+        table[str(i)] = i * i
+    sorted(table.items(), key=lambda item: item[1] % 97)
+    return time.perf_counter() - start
+
+
+def measure(config):
+    """Return `{metric: (seconds, calibration units)}` for one scenario.
+
+    Calibrations are interleaved with the runs and the best of each is used,
+    so a machine that is uniformly slower or busier than the one that
+    recorded the baseline gives about the same ratio.
+    """
+    # Warm runs reuse loaded modules; the first one pays for the imports, so
+    # it is left out. Module loading is covered by cold_start.
+    run_program(config)
+    calibrations = [calibrate()]
+    samples = {metric: [] for metric in METRICS}
+    for _ in range(ROUNDS):
+        run = run_program(config)
+        samples["evaluation"].append(run.evaluation_seconds)
+        samples["registration"].append(run.registration_seconds)
+        calibrations.append(calibrate())
+    for _ in range(COLD_ROUNDS):
+        samples["cold_start"].append(run_program_cold(config))
+        calibrations.append(calibrate())
+    unit = min(calibrations)
+    return {
+        metric: (min(values), min(values) / unit) for metric, values in samples.items()
+    }
+
+
+@pytest.fixture(scope="module")
+def measured():
+    return {scenario: measure(config) for scenario, config in SCENARIOS.items()}
+
+
+@pytest.fixture(scope="module")
+def baseline(measured):
+    if UPDATE_BENCHMARK_BASELINE:
+        units = {
+            scenario: {
+                metric: round(sample[1], 3) for metric, sample in metrics.items()
+            }
+            for scenario, metrics in measured.items()
+        }
+        BENCHMARK_BASELINE.write_text(
+            json.dumps(units, indent=2, sort_keys=True) + "\n"
+        )
+    return json.loads(BENCHMARK_BASELINE.read_text())
+
+
+@pytest.mark.parametrize("metric", METRICS)
+@pytest.mark.parametrize("scenario", sorted(SCENARIOS))
+def test_timing(measured, baseline, scenario, metric, record_property):
+    seconds, units = measured[scenario][metric]
+    record_property(f"{scenario}.{metric}_seconds", seconds)
+    record_property(f"{scenario}.{metric}_units", units)
+    if metric in LIMITS:
+        assert seconds <= LIMITS[metric], (
+            f"{scenario} {metric} took {seconds * 1000:.1f}ms, "
+            f"limit {LIMITS[metric] * 1000:.1f}ms"
+        )
+        return
+    expected = baseline[scenario][metric]
+    allowed = expected * (1 + TOLERANCE)
+    assert units <= allowed, (
+        f"{scenario} {metric} regressed: {units:.2f} vs baseline {expected:.2f} "
+        f"calibration units (+{TOLERANCE:.0%} allowed)"
+    )
@@ -0,0 +1,66 @@
+import difflib
+
+import pytest
+
+from harness import (
+    SCENARIOS,
+    SNAPSHOT_DIR,
+    UPDATE_SNAPSHOTS,
+    render,
+    run_program,
+    snapshot_name,
+)
+
+
+def golden_files(scenario):
+    return sorted((SNAPSHOT_DIR / scenario).glob("*.yaml"))
+
+
+@pytest.fixture(scope="module")
+def rendered():
+    result = {}
+    for scenario, config in SCENARIOS.items():
+        run = run_program(config)
+        names = [snapshot_name(args) for args in run.registrations]
+        assert len(names) == len(set(names)), "snapshot file names must be unique"
+        result[scenario] = {
+            snapshot_name(args): render(args) for args in run.registrations
+        }
+    return result
+
+
+@pytest.mark.parametrize("scenario", sorted(SCENARIOS))
+def test_resource_set_matches_snapshots(rendered, scenario):
+    if UPDATE_SNAPSHOTS:
+        directory = SNAPSHOT_DIR / scenario
+        directory.mkdir(parents=True, exist_ok=True)
+        for stale in directory.glob("*.yaml"):
+            if stale.name not in rendered[scenario]:
+                stale.unlink()
+        for name, text in rendered[scenario].items():
+            (directory / name).write_text(text)
+
+    golden = {path.name for path in golden_files(scenario)}
+    assert sorted(rendered[scenario]) == sorted(golden)
+
+
+@pytest.mark.parametrize(
+    "scenario,name",
+    [
+        (scenario, path.name)
+        for scenario in sorted(SCENARIOS)
+        for path in golden_files(scenario)
+    ],
+)
+def test_rendered_resource_matches_snapshot(rendered, scenario, name):
+    expected = (SNAPSHOT_DIR / scenario / name).read_text()
+    actual = rendered[scenario].get(name, "")
+    diff = "".join(
+        difflib.unified_diff(
+            expected.splitlines(keepends=True),
+            actual.splitlines(keepends=True),
+            fromfile=f"snapshots/{scenario}/{name}",
+            tofile="rendered",
+        )
+    )
+    assert actual == expected, diff
@@ -0,0 +1,61 @@
+import logging
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+from harness import PROGRAM_DIR, run_program
+
+# Profile in a fresh interpreter so the imports are real loads rather than
+# sys.modules hits left behind by earlier tests.
+_PROFILE = """
+import logging, sys
+logging.basicConfig(level=logging.INFO, stream=sys.stdout, format="%(message)s")
+sys.path.insert(0, sys.argv[1])
+from harness import run_program
+run_program({"kube_nfs:profileImports": "true"})
+"""
+_ENTRY = re.compile(r"^import (\S+): ([\d.]+)ms \((\d+) modules\)$", re.MULTILINE)
+
+
+def test_demo_clients_not_imported_by_default():
+    sys.modules.pop("demo_clients", None)
+    run_program()
+    assert "demo_clients" not in sys.modules
+
+
+def test_demo_clients_imported_when_enabled():
+    sys.modules.pop("demo_clients", None)
+    run_program({"kube_nfs:demo": "true"})
+    assert "demo_clients" in sys.modules
+
+
+def test_profile_imports_reports_module_load_cost():
+    result = subprocess.run(
+        [sys.executable, "-c", _PROFILE, str(Path(__file__).resolve().parent)],
+        cwd=PROGRAM_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    entries = {
+        name: (float(ms), int(modules))
+        for name, ms, modules in _ENTRY.findall(result.stdout)
+    }
+    core_ms, core_modules = entries["pulumi_kubernetes.core.v1"]
+    assert core_ms > 0
+    assert core_modules > 0
+    # The harness imports pulumi before running the program, as the language
+    # host does, so that cost shows up as startup CPU time instead.
+    assert "pulumi" in entries
+    startup = re.search(
+        r"^startup before program: ([\d.]+)ms CPU$", result.stdout, re.M
+    )
+    assert float(startup.group(1)) > 0
+    assert "measured imports:" in result.stdout
+
+
+def test_profile_imports_silent_by_default(caplog):
+    with caplog.at_level(logging.INFO):
+        run_program()
+    assert "measured imports:" not in caplog.text